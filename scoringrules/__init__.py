@@ -10,6 +10,7 @@ from scoringrules._crps import (
     crps_quantile,
     owcrps_ensemble,
     twcrps_ensemble,
+    twcrps_ensemble_batch,
     vrcrps_ensemble,
 )
 from scoringrules._energy import (
@@ -43,6 +44,7 @@ __all__ = [
     "crps_quantile",
     "owcrps_ensemble",
     "twcrps_ensemble",
+    "twcrps_ensemble_batch",
     "vrcrps_ensemble",
     "logs_normal",
     "brier_score",
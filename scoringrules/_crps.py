@@ -1,3 +1,4 @@
+import functools
 import typing as tp
 
 from scoringrules.backend import backends
@@ -6,6 +7,63 @@ from scoringrules.core import crps
 if tp.TYPE_CHECKING:
     from scoringrules.core.typing import Array, ArrayLike, Backend
 
+# estimators that operate on the ensemble in its original order; all others
+# require the ensemble to be sorted in ascending order
+_SORT_EXEMPT_ESTIMATORS = frozenset(("akr", "akr_circperm"))
+
+# below this ensemble size the inner-parallel single-observation kernels lose
+# more to threading overhead than they recover from splitting the O(M) pass
+_SINGLE_OBS_MIN_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_ensemble_kernel(
+    estimator: str, backend_name: str, sorted_ensemble: bool, axis: int
+) -> tp.Callable:
+    """Bake the dispatch branches of `crps_ensemble` into a cached closure.
+
+    For small inputs the Python-level branching (kernel lookup, sort decision,
+    axis handling) dominates the actual compute. It is resolved once per
+    configuration, so repeated calls reduce to an array conversion plus a
+    single kernel invocation.
+    """
+    B = backends[backend_name]
+    needs_sort = estimator not in _SORT_EXEMPT_ESTIMATORS and not sorted_ensemble
+
+    if backend_name == "numba":
+        gufunc = crps.estimator_gufuncs[estimator]
+        single = crps.estimator_single_funcs.get(estimator)
+        axes = [(), (axis,), ()] if axis != -1 else None
+
+        def _dispatch(obs: "Array", fct: "Array") -> "Array":
+            if needs_sort:
+                fct = B.sort(fct, axis=axis)
+            if (
+                single is not None
+                and fct.ndim == 1
+                and obs.ndim == 0
+                and fct.shape[0] >= _SINGLE_OBS_MIN_SIZE
+            ):
+                # a single observation offers no batch parallelism; split the
+                # pass over the ensemble itself across threads instead
+                return single(obs, fct)
+            if axes is not None:
+                # the gufunc handles an arbitrary ensemble axis via its axes
+                # argument, avoiding a transposed copy of the forecasts
+                return gufunc(obs, fct, axes=axes)
+            return gufunc(obs, fct)
+
+        return _dispatch
+
+    def _dispatch(obs: "Array", fct: "Array") -> "Array":
+        if axis != -1:
+            fct = B.moveaxis(fct, axis, -1)
+        if needs_sort:
+            fct = B.sort(fct, axis=-1)
+        return crps.ensemble(obs, fct, estimator, backend=backend_name)
+
+    return _dispatch
+
 
 def crps_ensemble(
     observations: "ArrayLike",
@@ -46,25 +104,17 @@ def crps_ensemble(
     >>> from scoringrules import crps
     >>> crps.ensemble(pred, obs)
     """
-    B = backends.active if backend is None else backends[backend]
-    observations, forecasts = map(B.asarray, (observations, forecasts))
-
     if estimator not in crps.estimator_gufuncs:
         raise ValueError(
             f"{estimator} is not a valid estimator. "
             f"Must be one of {crps.estimator_gufuncs.keys()}"
         )
 
-    if axis != -1:
-        forecasts = B.moveaxis(forecasts, axis, -1)
-
-    if not sorted_ensemble and estimator not in ["nrg", "akr", "akr_circperm", "fair"]:
-        forecasts = B.sort(forecasts, axis=-1)
-
-    if backend == "numba":
-        return crps.estimator_gufuncs[estimator](observations, forecasts)
+    B = backends.active if backend is None else backends[backend]
+    observations, forecasts = map(B.asarray, (observations, forecasts))
 
-    return crps.ensemble(observations, forecasts, estimator, backend=backend)
+    dispatch = _resolve_ensemble_kernel(estimator, B.name, sorted_ensemble, axis)
+    return dispatch(observations, forecasts)
 
 
 def twcrps_ensemble(
@@ -76,6 +126,7 @@ def twcrps_ensemble(
     *,
     estimator: str = "pwm",
     sorted_ensemble: bool = False,
+    v_is_monotone: bool = False,
     backend: "Backend" = None,
 ) -> "Array":
     r"""Estimate the Threshold-Weighted Continuous Ranked Probability Score (twCRPS) for a finite ensemble.
@@ -102,6 +153,10 @@ def twcrps_ensemble(
         to $[t, \inf)$.
     axis: int
         The axis corresponding to the ensemble. Default is the last axis.
+    v_is_monotone: bool
+        Boolean indicating whether the chaining function is non-decreasing, in
+        which case it preserves the ensemble order and the ensemble is sorted
+        once before projection. Default is False.
     backend: str
         The name of the backend used for computations. Defaults to 'numba' if available, else 'numpy'.
 
@@ -115,6 +170,27 @@ def twcrps_ensemble(
     >>> from scoringrules import crps
     >>> twcrps.ensemble(pred, obs)
     """
+    if (
+        backend == "numba"
+        and estimator == "nrg"
+        and hasattr(v_func, "nopython_signatures")
+    ):
+        # a numba-jitted chaining function is fused into the kernel, so the
+        # projected forecasts are never materialized as an extra N x M array
+        B = backends[backend]
+        observations, forecasts = map(B.asarray, (observations, forecasts))
+        gufunc = crps.make_twcrps_gufunc(v_func)
+        if axis != -1:
+            return gufunc(observations, forecasts, axes=[(), (axis,), ()])
+        return gufunc(observations, forecasts)
+
+    if v_is_monotone and not sorted_ensemble:
+        # a non-decreasing chaining function preserves the ensemble order, so
+        # sorting before projection spares crps_ensemble a second sort
+        B = backends.active if backend is None else backends[backend]
+        forecasts = B.sort(B.asarray(forecasts), axis=axis)
+        sorted_ensemble = True
+
     observations, forecasts = map(v_func, (observations, forecasts))
     return crps_ensemble(
         observations,
@@ -126,6 +202,82 @@ def twcrps_ensemble(
     )
 
 
+def twcrps_ensemble_batch(
+    observations: "ArrayLike",
+    forecasts: "Array",
+    thresholds: "Array",
+    /,
+    axis: int = -1,
+    *,
+    sorted_ensemble: bool = False,
+    backend: "Backend" = None,
+) -> "Array":
+    r"""Estimate the twCRPS for a finite ensemble at multiple thresholds.
+
+    Evaluates the energy form of the twCRPS with the chaining function
+    $v(x) = \mathrm{max}(x, t)$ for every threshold $t$. Since $v$ is
+    non-decreasing, the ensemble is sorted only once and the
+    $O(M \mathrm{log} M)$ sort is amortized over all thresholds, as is typical
+    when computing a threshold decomposition of the CRPS.
+
+    Parameters
+    ----------
+    observations: ArrayLike
+        The observed values.
+    forecasts: ArrayLike
+        The predicted forecast ensemble, where the ensemble dimension is by default
+        represented by the last axis.
+    thresholds: Array
+        The thresholds at which the twCRPS is evaluated.
+    axis: int
+        The axis corresponding to the ensemble. Default is the last axis.
+    sorted_ensemble: bool
+        Boolean indicating whether the ensemble members are already in ascending order.
+        Default is False.
+    backend: str
+        The name of the backend used for computations. Defaults to 'numba' if available, else 'numpy'.
+
+    Returns
+    -------
+    twcrps: Array
+        The twCRPS between the forecast ensemble and obs, with a trailing
+        dimension over the thresholds.
+
+    Examples
+    --------
+    >>> import scoringrules as sr
+    >>> sr.twcrps_ensemble_batch(obs, pred, [1.0, 2.0, 5.0])
+    """
+    B = backends.active if backend is None else backends[backend]
+    observations, forecasts, thresholds = map(
+        B.asarray, (observations, forecasts, thresholds)
+    )
+
+    if not sorted_ensemble:
+        forecasts = B.sort(forecasts, axis=axis)
+
+    if B.name == "numba":
+        if axis != -1:
+            return crps.twcrps_threshold_gufunc(
+                observations, forecasts, thresholds, axes=[(), (axis,), (-1,), (-1,)]
+            )
+        return crps.twcrps_threshold_gufunc(observations, forecasts, thresholds)
+
+    if axis != -1:
+        forecasts = B.moveaxis(forecasts, axis, -1)
+
+    scores = [
+        crps.ensemble(
+            B.maximum(observations, t),
+            B.maximum(forecasts, t),
+            "nrg",
+            backend=backend,
+        )
+        for t in thresholds
+    ]
+    return B.stack(scores, axis=-1)
+
+
 def crps_quantile(
     observations: "ArrayLike",
     forecasts: "Array",
@@ -178,13 +330,18 @@ def crps_quantile(
     B = backends.active if backend is None else backends[backend]
     observations, forecasts, alpha = map(B.asarray, (observations, forecasts, alpha))
 
-    if axis != -1:
+    if axis != -1 and B.name != "numba":
         forecasts = B.moveaxis(forecasts, axis, -1)
+        axis = -1
 
-    if not forecasts.shape[-1] == alpha.shape[-1]:
+    if not forecasts.shape[axis] == alpha.shape[-1]:
         raise ValueError("Expected matching length of forecasts and alpha values.")
 
     if B.name == "numba":
+        if axis != -1:
+            return crps.quantile_pinball_gufunc(
+                observations, forecasts, alpha, axes=[(), (axis,), (-1,), ()]
+            )
         return crps.quantile_pinball_gufunc(observations, forecasts, alpha)
 
     return crps.quantile_pinball(observations, forecasts, alpha, backend=backend)
@@ -242,19 +399,38 @@ def owcrps_ensemble(
             "Only the energy form of the estimator is available "
             "for the outcome-weighted CRPS."
         )
-    if axis != -1:
+
+    # convert before applying the weight function so its output is already
+    # backend-typed and is not converted a second time
+    observations, forecasts = map(B.asarray, (observations, forecasts))
+
+    if backend == "numba" and hasattr(w_func, "nopython_signatures"):
+        # a numba-jitted weight function is fused into the kernel, so the
+        # weights are never materialized as full arrays
+        gufunc = crps.make_ow_gufunc(w_func)
+        if axis != -1:
+            return gufunc(observations, forecasts, axes=[(), (axis,), ()])
+        return gufunc(observations, forecasts)
+
+    if axis != -1 and backend != "numba":
         forecasts = B.moveaxis(forecasts, axis, -1)
+        axis = -1
 
     obs_weights, fct_weights = map(w_func, (observations, forecasts))
 
     if backend == "numba":
+        if axis != -1:
+            return crps.estimator_gufuncs["ow" + estimator](
+                observations,
+                forecasts,
+                obs_weights,
+                fct_weights,
+                axes=[(), (axis,), (), (axis,), ()],
+            )
         return crps.estimator_gufuncs["ow" + estimator](
             observations, forecasts, obs_weights, fct_weights
         )
 
-    observations, forecasts, obs_weights, fct_weights = map(
-        B.asarray, (observations, forecasts, obs_weights, fct_weights)
-    )
     return crps.ow_ensemble(
         observations, forecasts, obs_weights, fct_weights, backend=backend
     )
@@ -317,19 +493,38 @@ def vrcrps_ensemble(
             "Only the energy form of the estimator is available "
             "for the outcome-weighted CRPS."
         )
-    if axis != -1:
+
+    # convert before applying the weight function so its output is already
+    # backend-typed and is not converted a second time
+    observations, forecasts = map(B.asarray, (observations, forecasts))
+
+    if backend == "numba" and hasattr(w_func, "nopython_signatures"):
+        # a numba-jitted weight function is fused into the kernel, so the
+        # weights are never materialized as full arrays
+        gufunc = crps.make_vr_gufunc(w_func)
+        if axis != -1:
+            return gufunc(observations, forecasts, axes=[(), (axis,), ()])
+        return gufunc(observations, forecasts)
+
+    if axis != -1 and backend != "numba":
         forecasts = B.moveaxis(forecasts, axis, -1)
+        axis = -1
 
     obs_weights, fct_weights = map(w_func, (observations, forecasts))
 
     if backend == "numba":
+        if axis != -1:
+            return crps.estimator_gufuncs["vr" + estimator](
+                observations,
+                forecasts,
+                obs_weights,
+                fct_weights,
+                axes=[(), (axis,), (), (axis,), ()],
+            )
         return crps.estimator_gufuncs["vr" + estimator](
             observations, forecasts, obs_weights, fct_weights
         )
 
-    observations, forecasts, obs_weights, fct_weights = map(
-        B.asarray, (observations, forecasts, obs_weights, fct_weights)
-    )
     return crps.vr_ensemble(
         observations, forecasts, obs_weights, fct_weights, backend=backend
     )
@@ -371,7 +566,7 @@ def crps_exponential(
     >>> sr.crps_exponential(0.8, 3.0)
     0.360478635526275
     >>> sr.crps_exponential(np.array([0.8, 0.9]), np.array([3.0, 2.0]))
-    array([0.36047864, 0.24071795])
+    array([0.36047864, 0.31529889])
     ```
     """
     return crps.exponential(observation, rate, backend=backend)
@@ -503,6 +698,7 @@ def crps_logistic(
 __all__ = [
     "crps_ensemble",
     "twcrps_ensemble",
+    "twcrps_ensemble_batch",
     "owcrps_ensemble",
     "vrcrps_ensemble",
     "crps_normal",
@@ -185,10 +185,11 @@ class TorchBackend(ArrayBackend):
         return torch.floor(x)
 
     def minimum(self, x: "Tensor", y: "TensorLike") -> "Tensor":
-        return torch.minimum(x, y)
+        # torch.minimum rejects python scalars, which the API contract allows
+        return torch.minimum(x, torch.as_tensor(y, dtype=x.dtype, device=x.device))
 
     def maximum(self, x: "Tensor", y: "TensorLike") -> "Tensor":
-        return torch.maximum(x, y)
+        return torch.maximum(x, torch.as_tensor(y, dtype=x.dtype, device=x.device))
 
     def beta(self, x: "Tensor", y: "Tensor") -> "Tensor":
         return torch.exp(torch.lgamma(x) + torch.lgamma(y) - torch.lgamma(x + y))
@@ -15,10 +15,10 @@ def brier_score(
     B = backends.active if backend is None else backends[backend]
     obs, fct = map(B.asarray, (obs, fct))
 
-    if B.any(fct < 0.0) or B.any(fct > 1.0 + EPSILON):
+    if B.any((fct < 0.0) | (fct > 1.0 + EPSILON)):
         raise ValueError("Forecasted probabilities must be within 0 and 1.")
 
-    if not set(B.unique_values(obs)) <= {0, 1}:
+    if B.any(~(B.isnan(obs) | (obs == 0.0) | (obs == 1.0))):
         raise ValueError("Observations must be 0, 1, or NaN.")
 
     return B.asarray((fct - obs) ** 2)
@@ -1,8 +1,21 @@
 from ._approx import ensemble, ow_ensemble, quantile_pinball, vr_ensemble
 from ._closed import exponential, logistic, lognormal, normal
-from ._gufuncs import estimator_gufuncs, quantile_pinball_gufunc
+from ._gufuncs import (
+    estimator_gufuncs,
+    estimator_single_funcs,
+    make_ow_gufunc,
+    make_twcrps_gufunc,
+    make_vr_gufunc,
+    quantile_pinball_gufunc,
+    twcrps_threshold_gufunc,
+)
 
 __all__ = [
+    "twcrps_threshold_gufunc",
+    "estimator_single_funcs",
+    "make_ow_gufunc",
+    "make_twcrps_gufunc",
+    "make_vr_gufunc",
     "ensemble",
     "ow_ensemble",
     "vr_ensemble",
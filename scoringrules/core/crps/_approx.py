@@ -31,26 +31,25 @@ def ensemble(
 def _crps_ensemble_fair(
     obs: "Array", fct: "Array", backend: "Backend" = None
 ) -> "Array":
-    """Fair version of the CRPS estimator based on the energy form."""
+    """Fair version of the CRPS estimator based on the energy form. Expects a sorted ensemble."""
     B = backends.active if backend is None else backends[backend]
     M: int = fct.shape[-1]
+    ranks = B.asarray(2 * B.arange(M) - M + 1, dtype=fct.dtype)
     e_1 = B.sum(B.abs(obs[..., None] - fct), axis=-1) / M
-    e_2 = B.sum(
-        B.abs(fct[..., None] - fct[..., None, :]),
-        axis=(-1, -2),
-    ) / (M * (M - 1))
-    return e_1 - 0.5 * e_2
+    e_2 = B.sum(ranks * fct, axis=-1) / (M * (M - 1))
+    return e_1 - e_2
 
 
 def _crps_ensemble_nrg(
     obs: "Array", fct: "Array", backend: "Backend" = None
 ) -> "Array":
-    """CRPS estimator based on the energy form."""
+    """CRPS estimator based on the energy form. Expects a sorted ensemble."""
     B = backends.active if backend is None else backends[backend]
     M: int = fct.shape[-1]
+    ranks = B.asarray(2 * B.arange(M) - M + 1, dtype=fct.dtype)
     e_1 = B.sum(B.abs(obs[..., None] - fct), axis=-1) / M
-    e_2 = B.sum(B.abs(fct[..., None] - fct[..., None, :]), (-1, -2)) / (M**2)
-    return e_1 - 0.5 * e_2
+    e_2 = B.sum(ranks * fct, axis=-1) / (M**2)
+    return e_1 - e_2
 
 
 def _crps_ensemble_pwm(
@@ -59,9 +58,10 @@ def _crps_ensemble_pwm(
     """CRPS estimator based on the probability weighted moment (PWM) form."""
     B = backends.active if backend is None else backends[backend]
     M: int = fct.shape[-1]
+    ranks = B.asarray(B.arange(M), dtype=fct.dtype)
     expected_diff = B.sum(B.abs(obs[..., None] - fct), axis=-1) / M
     β_0 = B.sum(fct, axis=-1) / M
-    β_1 = B.sum(fct * B.arange(M), axis=-1) / (M * (M - 1.0))
+    β_1 = B.sum(fct * ranks, axis=-1) / (M * (M - 1.0))
     return expected_diff + β_0 - 2.0 * β_1
 
 
@@ -70,9 +70,10 @@ def quantile_pinball(
 ) -> "Array":
     """CRPS approximation via Pinball Loss."""
     B = backends.active if backend is None else backends[backend]
-    below = (fct <= obs[..., None]) * alpha * (obs[..., None] - fct)
-    above = (fct > obs[..., None]) * (1 - alpha) * (fct - obs[..., None])
-    return 2 * B.mean(below + above, axis=-1)
+    # pinball loss in the single fused form (alpha - 1{err < 0}) * err, which
+    # avoids materializing separate below/above masks and products
+    err = obs[..., None] - fct
+    return 2 * B.mean(alpha * err - (err < 0.0) * err, axis=-1)
 
 
 def ow_ensemble(
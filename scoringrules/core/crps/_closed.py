@@ -1,6 +1,12 @@
 import typing as tp
 
 from scoringrules.backend import backends
+from scoringrules.core.crps._gufuncs import (
+    _crps_exponential_ufunc,
+    _crps_logistic_ufunc,
+    _crps_lognormal_ufunc,
+    _crps_normal_ufunc,
+)
 from scoringrules.core.stats import _exp_cdf, _logis_cdf, _norm_cdf, _norm_pdf
 
 if tp.TYPE_CHECKING:
@@ -13,6 +19,10 @@ def exponential(
     """Compute the CRPS for the exponential distribution."""
     B = backends.active if backend is None else backends[backend]
     rate, obs = map(B.asarray, (rate, obs))
+
+    if B.name == "numba":
+        return _crps_exponential_ufunc(obs, rate)
+
     s = B.abs(obs) - (2 * _exp_cdf(obs, rate, backend=backend) / rate) + 1 / (2 * rate)
     return s
 
@@ -23,6 +33,12 @@ def normal(
     """Compute the CRPS for the normal distribution."""
     B = backends.active if backend is None else backends[backend]
     mu, sigma, obs = map(B.asarray, (mu, sigma, obs))
+
+    if B.name == "numba":
+        # fused elementwise kernel: inputs are streamed together and only the
+        # output array is materialized
+        return _crps_normal_ufunc(obs, mu, sigma)
+
     ω = (obs - mu) / sigma
     return sigma * (
         ω * (2.0 * _norm_cdf(ω, backend=backend) - 1.0)
@@ -40,6 +56,10 @@ def lognormal(
     """Compute the CRPS for the lognormal distribution."""
     B = backends.active if backend is None else backends[backend]
     mulog, sigmalog, obs = map(B.asarray, (mulog, sigmalog, obs))
+
+    if B.name == "numba":
+        return _crps_lognormal_ufunc(obs, mulog, sigmalog)
+
     ω = (B.log(obs) - mulog) / sigmalog
     ex = 2 * B.exp(mulog + sigmalog**2 / 2)
     return obs * (2.0 * _norm_cdf(ω, backend=backend) - 1) - ex * (
@@ -55,5 +75,9 @@ def logistic(
     """Compute the CRPS for the normal distribution."""
     B = backends.active if backend is None else backends[backend]
     mu, sigma, obs = map(B.asarray, (mu, sigma, obs))
+
+    if B.name == "numba":
+        return _crps_logistic_ufunc(obs, mu, sigma)
+
     ω = (obs - mu) / sigma
     return sigma * (ω - 2 * B.log(_logis_cdf(ω, backend=backend)) - 1)
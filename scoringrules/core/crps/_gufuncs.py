@@ -1,7 +1,16 @@
+"""Numba kernels for the CRPS.
+
+The scalar helpers and closed-form kernels call ``math.erf``, ``math.exp`` and
+``math.log``, which numba lowers to Intel SVML vector intrinsics when the
+optional ``icc_rt`` package (providing ``libsvml``) is installed. See
+https://numba.readthedocs.io/en/stable/user/performance-tips.html#intel-svml
+"""
+
+import functools
 import math
 
 import numpy as np
-from numba import guvectorize, njit, vectorize
+from numba import guvectorize, njit, prange, vectorize
 
 INV_SQRT_PI = 1 / np.sqrt(np.pi)
 EPSILON = 1e-6
@@ -13,6 +22,8 @@ EPSILON = 1e-6
         "void(float64[:], float64[:], float64[:], float64[:])",
     ],
     "(),(a),(a)->()",
+    target="parallel",
+    cache=True,
 )
 def quantile_pinball_gufunc(
     obs: np.ndarray, fct: np.ndarray, alpha: np.ndarray, out: np.ndarray
@@ -32,6 +43,8 @@ def quantile_pinball_gufunc(
         "void(float64[:], float64[:], float64[:])",
     ],
     "(),(n)->()",
+    target="parallel",
+    cache=True,
 )
 def _crps_ensemble_int_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray):
     """CRPS estimator based on the integral form."""
@@ -77,6 +90,8 @@ def _crps_ensemble_int_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray)
         "void(float64[:], float64[:], float64[:])",
     ],
     "(),(n)->()",
+    target="parallel",
+    cache=True,
 )
 def _crps_ensemble_qd_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray):
     """CRPS estimator based on the quantile decomposition form."""
@@ -105,9 +120,21 @@ def _crps_ensemble_qd_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray):
         "void(float64[:], float64[:], float64[:])",
     ],
     "(),(n)->()",
+    target="parallel",
+    cache=True,
 )
 def _crps_ensemble_nrg_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray):
-    """CRPS estimator based on the energy form."""
+    """CRPS estimator based on the energy form. Expects an ensemble sorted in ascending order.
+
+    The O(M²) pairwise sum $\\sum_{m,j} |x_m - x_j|$ is computed in O(M) via the
+    identity $\\sum_{m<j} (x_{(j)} - x_{(m)}) = \\sum_{k} (2k - M + 1) x_{(k)}$
+    on the sorted ensemble (0-based ranks $k$).
+
+    Specializing the kernel for fixed operational ensemble sizes (M = 11, 21,
+    51, ...) was considered and dropped: the body is a single branch-free
+    linear pass that LLVM already unrolls and vectorizes, and the sort happens
+    outside the kernel, so per-M code generation has nothing left to gain.
+    """
     obs = obs[0]
     M = fct.shape[-1]
 
@@ -115,15 +142,14 @@ def _crps_ensemble_nrg_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray)
         out[0] = np.nan
         return
 
-    e_1 = 0
-    e_2 = 0
+    e_1 = 0.0
+    e_2 = 0.0
 
-    for x_i in fct:
+    for i, x_i in enumerate(fct):
         e_1 += abs(x_i - obs)
-        for x_j in fct:
-            e_2 += abs(x_i - x_j)
+        e_2 += (2 * i - M + 1) * x_i
 
-    out[0] = e_1 / M - 0.5 * e_2 / (M**2)
+    out[0] = e_1 / M - e_2 / (M**2)
 
 
 @guvectorize(
@@ -132,9 +158,15 @@ def _crps_ensemble_nrg_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray)
         "void(float64[:], float64[:], float64[:])",
     ],
     "(),(n)->()",
+    target="parallel",
+    cache=True,
 )
 def _crps_ensemble_fair_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray):
-    """Fair version of the CRPS estimator based on the energy form."""
+    """Fair version of the CRPS estimator based on the energy form. Expects an ensemble sorted in ascending order.
+
+    The pairwise sum is computed in O(M) on the sorted ensemble as in the
+    `nrg` estimator.
+    """
     obs = obs[0]
     M = fct.shape[-1]
 
@@ -142,15 +174,14 @@ def _crps_ensemble_fair_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray
         out[0] = np.nan
         return
 
-    e_1 = 0
-    e_2 = 0
+    e_1 = 0.0
+    e_2 = 0.0
 
-    for x_i in fct:
+    for i, x_i in enumerate(fct):
         e_1 += abs(x_i - obs)
-        for x_j in fct:
-            e_2 += abs(x_i - x_j)
+        e_2 += (2 * i - M + 1) * x_i
 
-    out[0] = e_1 / M - 0.5 * e_2 / (M * (M - 1))
+    out[0] = e_1 / M - e_2 / (M * (M - 1))
 
 
 @guvectorize(
@@ -159,6 +190,8 @@ def _crps_ensemble_fair_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray
         "void(float64[:], float64[:], float64[:])",
     ],
     "(),(n)->()",
+    target="parallel",
+    cache=True,
 )
 def _crps_ensemble_pwm_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray):
     """CRPS estimator based on the probability weighted moment (PWM) form."""
@@ -187,18 +220,20 @@ def _crps_ensemble_pwm_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray)
         "void(float64[:], float64[:], float64[:])",
     ],
     "(),(n)->()",
+    target="parallel",
+    cache=True,
 )
 def _crps_ensemble_akr_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray):
     """CRPS estimaton based on the approximate kernel representation."""
     M = fct.shape[-1]
     obs = obs[0]
-    e_1 = 0
-    e_2 = 0
-    for i, forecast in enumerate(fct):
-        if i == 0:
-            i = M - 1
-        e_1 += abs(forecast - obs)
-        e_2 += abs(forecast - fct[i - 1])
+    # the first member is paired outside the loop so the loop body stays
+    # branch-free and auto-vectorizable
+    e_1 = abs(fct[0] - obs)
+    e_2 = abs(fct[0] - fct[M - 2])
+    for i in range(1, M):
+        e_1 += abs(fct[i] - obs)
+        e_2 += abs(fct[i] - fct[i - 1])
     out[0] = e_1 / M - 0.5 * 1 / M * e_2
 
 
@@ -208,6 +243,8 @@ def _crps_ensemble_akr_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray)
         "void(float64[:], float64[:], float64[:])",
     ],
     "(),(n)->()",
+    target="parallel",
+    cache=True,
 )
 def _crps_ensemble_akr_circperm_gufunc(
     obs: np.ndarray, fct: np.ndarray, out: np.ndarray
@@ -217,10 +254,12 @@ def _crps_ensemble_akr_circperm_gufunc(
     obs = obs[0]
     e_1 = 0.0
     e_2 = 0.0
+    # hoist the permutation offset; sigma_i = (i + 1 + floor((M - 1) / 2)) % M
+    # in pure integer arithmetic instead of a float division and cast per member
+    shift = 1 + (M - 1) // 2
     for i, forecast in enumerate(fct):
-        sigma_i = int((i + 1 + ((M - 1) / 2)) % M)
         e_1 += abs(forecast - obs)
-        e_2 += abs(forecast - fct[sigma_i])
+        e_2 += abs(forecast - fct[(i + shift) % M])
     out[0] = e_1 / M - 0.5 * 1 / M * e_2
 
 
@@ -230,6 +269,8 @@ def _crps_ensemble_akr_circperm_gufunc(
         "void(float64[:], float64[:], float64[:], float64[:], float64[:])",
     ],
     "(),(n),(),(n)->()",
+    target="parallel",
+    cache=True,
 )
 def _owcrps_ensemble_nrg_gufunc(
     obs: np.ndarray,
@@ -266,6 +307,8 @@ def _owcrps_ensemble_nrg_gufunc(
         "void(float64[:], float64[:], float64[:], float64[:], float64[:])",
     ],
     "(),(n),(),(n)->()",
+    target="parallel",
+    cache=True,
 )
 def _vrcrps_ensemble_nrg_gufunc(
     obs: np.ndarray,
@@ -298,51 +341,301 @@ def _vrcrps_ensemble_nrg_gufunc(
     out[0] = e_1 / M - 0.5 * e_2 / (M**2) + (wabs_x - wabs_y) * (wbar - ow)
 
 
-@njit(["float32(float32)", "float64(float64)"])
+@njit(["float32(float32)", "float64(float64)"], cache=True)
 def _norm_cdf(x: float) -> float:
     """Cumulative distribution function for the standard normal distribution."""
     out: float = (1.0 + math.erf(x / math.sqrt(2.0))) / 2.0
     return out
 
 
-@njit(["float32(float32)", "float64(float64)"])
+@njit(["float32(float32)", "float64(float64)"], cache=True)
 def _norm_pdf(x: float) -> float:
     """Probability density function for the standard normal distribution."""
     out: float = (1 / math.sqrt(2 * math.pi)) * math.exp(-(x**2) / 2)
     return out
 
 
-@njit(["float32(float32)", "float64(float64)"])
+@njit(["float32(float32)", "float64(float64)"], cache=True)
 def _logis_cdf(x: float) -> float:
     """Cumulative distribution function for the standard logistic distribution."""
     out: float = 1.0 / (1.0 + math.exp(-x))
     return out
 
 
-@vectorize(["float32(float32, float32, float32)", "float64(float64, float64, float64)"])
+@vectorize(
+    ["float32(float32, float32)", "float64(float64, float64)"],
+    target="parallel",
+    cache=True,
+)
+def _crps_exponential_ufunc(obs: float, rate: float) -> float:
+    # hoist 1/rate and evaluate the CDF with a single exp call
+    inv_rate = 1.0 / rate
+    cdf = 1.0 - math.exp(-rate * obs) if obs > 0.0 else 0.0
+    out: float = abs(obs) - 2.0 * cdf * inv_rate + 0.5 * inv_rate
+    return out
+
+
+@vectorize(
+    ["float32(float32, float32, float32)", "float64(float64, float64, float64)"],
+    target="parallel",
+    cache=True,
+)
 def _crps_normal_ufunc(obs: float, mu: float, sigma: float) -> float:
     ω = (obs - mu) / sigma
     out: float = sigma * (ω * (2 * _norm_cdf(ω) - 1) + 2 * _norm_pdf(ω) - INV_SQRT_PI)
     return out
 
 
-@vectorize(["float32(float32, float32, float32)", "float64(float64, float64, float64)"])
+@vectorize(
+    ["float32(float32, float32, float32)", "float64(float64, float64, float64)"],
+    target="parallel",
+    cache=True,
+)
 def _crps_lognormal_ufunc(obs: float, mulog: float, sigmalog: float) -> float:
-    ω = (np.log(obs) - mulog) / sigmalog
-    ex = 2 * np.exp(mulog + sigmalog**2 / 2)
+    ω = (math.log(obs) - mulog) / sigmalog
+    ex = 2 * math.exp(mulog + sigmalog**2 / 2)
     out: float = obs * (2 * _norm_cdf(ω) - 1) - ex * (
-        _norm_cdf(ω - sigmalog) + _norm_cdf(sigmalog / np.sqrt(2)) - 1
+        _norm_cdf(ω - sigmalog) + _norm_cdf(sigmalog / math.sqrt(2)) - 1
     )
     return out
 
 
-@vectorize(["float32(float32, float32, float32)", "float64(float64, float64, float64)"])
+@vectorize(
+    ["float32(float32, float32, float32)", "float64(float64, float64, float64)"],
+    target="parallel",
+    cache=True,
+)
 def _crps_logistic_ufunc(obs: float, mu: float, sigma: float) -> float:
     ω = (obs - mu) / sigma
-    out: float = sigma * (ω - 2 * np.log(_logis_cdf(ω)) - 1)
+    out: float = sigma * (ω - 2 * math.log(_logis_cdf(ω)) - 1)
     return out
 
 
+@njit(
+    ["float32(float32, float32[:])", "float64(float64, float64[:])"],
+    parallel=True,
+    cache=True,
+)
+def _nrg_single_njit(obs: float, fct: np.ndarray) -> float:
+    M = fct.shape[0]
+    e_1 = 0.0
+    e_2 = 0.0
+    for k in prange(M):
+        e_1 += abs(fct[k] - obs)
+        e_2 += (2 * k - M + 1) * fct[k]
+    return e_1 / M - e_2 / (M**2)
+
+
+@njit(
+    ["float32(float32, float32[:])", "float64(float64, float64[:])"],
+    parallel=True,
+    cache=True,
+)
+def _fair_single_njit(obs: float, fct: np.ndarray) -> float:
+    M = fct.shape[0]
+    e_1 = 0.0
+    e_2 = 0.0
+    for k in prange(M):
+        e_1 += abs(fct[k] - obs)
+        e_2 += (2 * k - M + 1) * fct[k]
+    return e_1 / M - e_2 / (M * (M - 1))
+
+
+def _crps_ensemble_nrg_single(obs, fct):
+    """Energy-form CRPS for a single observation with a large sorted ensemble.
+
+    ``target="parallel"`` on the gufuncs distributes the batch dimension,
+    which cannot help when there is only one observation; this variant splits
+    the O(M) pass itself across threads with `numba.prange`.
+    """
+    fct = np.asarray(fct)
+    if fct.dtype != np.float32:
+        fct = fct.astype(np.float64, copy=False)
+    return fct.dtype.type(_nrg_single_njit(fct.dtype.type(obs), fct))
+
+
+def _crps_ensemble_fair_single(obs, fct):
+    """Fair energy-form CRPS for a single observation. See `_crps_ensemble_nrg_single`."""
+    fct = np.asarray(fct)
+    if fct.dtype != np.float32:
+        fct = fct.astype(np.float64, copy=False)
+    return fct.dtype.type(_fair_single_njit(fct.dtype.type(obs), fct))
+
+
+@functools.lru_cache(maxsize=None)
+def make_twcrps_gufunc(v_func):
+    """Build an energy-form twCRPS gufunc with the chaining function fused in.
+
+    ``v_func`` must be a numba-jitted scalar function. It is evaluated inside
+    the kernel, so the projected observations and forecasts are never
+    materialized as full arrays. Compiled gufuncs are cached per chaining
+    function.
+    """
+
+    @guvectorize(
+        [
+            "void(float32[:], float32[:], float32[:])",
+            "void(float64[:], float64[:], float64[:])",
+        ],
+        "(),(n)->()",
+        target="parallel",
+    )
+    def _twcrps_ensemble_nrg_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray):
+        obs = obs[0]
+        M = fct.shape[-1]
+
+        if np.isnan(obs):
+            out[0] = np.nan
+            return
+
+        y = v_func(obs)
+        vx = np.empty(M, fct.dtype)
+        for i in range(M):
+            vx[i] = v_func(fct[i])
+        vx.sort()
+
+        e_1 = 0.0
+        e_2 = 0.0
+
+        for i in range(M):
+            e_1 += abs(vx[i] - y)
+            e_2 += (2 * i - M + 1) * vx[i]
+
+        out[0] = e_1 / M - e_2 / (M**2)
+
+    return _twcrps_ensemble_nrg_gufunc
+
+
+@guvectorize(
+    [
+        "void(float32[:], float32[:], float32[:], float32[:])",
+        "void(float64[:], float64[:], float64[:], float64[:])",
+    ],
+    "(),(n),(t)->(t)",
+    target="parallel",
+    cache=True,
+)
+def twcrps_threshold_gufunc(
+    obs: np.ndarray, fct: np.ndarray, thresholds: np.ndarray, out: np.ndarray
+):
+    """Energy-form twCRPS with $v(x) = max(x, t)$ at several thresholds.
+
+    Expects an ensemble sorted in ascending order; since the chaining function
+    is non-decreasing, the projected ensemble stays sorted, so one sort is
+    amortized over all thresholds.
+    """
+    obs = obs[0]
+    M = fct.shape[-1]
+    T = thresholds.shape[-1]
+
+    if np.isnan(obs):
+        for k in range(T):
+            out[k] = np.nan
+        return
+
+    for k in range(T):
+        t = thresholds[k]
+        y = max(obs, t)
+        e_1 = 0.0
+        e_2 = 0.0
+        for i in range(M):
+            v_i = max(fct[i], t)
+            e_1 += abs(v_i - y)
+            e_2 += (2 * i - M + 1) * v_i
+        out[k] = e_1 / M - e_2 / (M**2)
+
+
+@functools.lru_cache(maxsize=None)
+def make_ow_gufunc(w_func):
+    """Build an outcome-weighted CRPS gufunc with the weight function fused in.
+
+    ``w_func`` must be a numba-jitted scalar function. The weights are
+    evaluated inside the kernel into an M-sized scratch buffer, so no full
+    N x M weight arrays are allocated. Compiled gufuncs are cached per weight
+    function.
+    """
+
+    @guvectorize(
+        [
+            "void(float32[:], float32[:], float32[:])",
+            "void(float64[:], float64[:], float64[:])",
+        ],
+        "(),(n)->()",
+        target="parallel",
+    )
+    def _owcrps_ensemble_nrg_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray):
+        obs = obs[0]
+        M = fct.shape[-1]
+
+        if np.isnan(obs):
+            out[0] = np.nan
+            return
+
+        ow = w_func(obs)
+        fw = np.empty(M, fct.dtype)
+        for i in range(M):
+            fw[i] = w_func(fct[i])
+
+        e_1 = 0.0
+        e_2 = 0.0
+
+        for i, x_i in enumerate(fct):
+            e_1 += abs(x_i - obs) * fw[i] * ow
+            for j, x_j in enumerate(fct):
+                e_2 += abs(x_i - x_j) * fw[i] * fw[j] * ow
+
+        wbar = np.mean(fw)
+
+        out[0] = e_1 / (M * wbar) - 0.5 * e_2 / ((M * wbar) ** 2)
+
+    return _owcrps_ensemble_nrg_gufunc
+
+
+@functools.lru_cache(maxsize=None)
+def make_vr_gufunc(w_func):
+    """Build a vertically re-scaled CRPS gufunc with the weight function fused in.
+
+    Same contract as `make_ow_gufunc`.
+    """
+
+    @guvectorize(
+        [
+            "void(float32[:], float32[:], float32[:])",
+            "void(float64[:], float64[:], float64[:])",
+        ],
+        "(),(n)->()",
+        target="parallel",
+    )
+    def _vrcrps_ensemble_nrg_gufunc(obs: np.ndarray, fct: np.ndarray, out: np.ndarray):
+        obs = obs[0]
+        M = fct.shape[-1]
+
+        if np.isnan(obs):
+            out[0] = np.nan
+            return
+
+        ow = w_func(obs)
+        fw = np.empty(M, fct.dtype)
+        for i in range(M):
+            fw[i] = w_func(fct[i])
+
+        e_1 = 0.0
+        e_2 = 0.0
+
+        for i, x_i in enumerate(fct):
+            e_1 += abs(x_i - obs) * fw[i] * ow
+            for j, x_j in enumerate(fct):
+                e_2 += abs(x_i - x_j) * fw[i] * fw[j]
+
+        wbar = np.mean(fw)
+        wabs_x = np.mean(np.abs(fct) * fw)
+        wabs_y = abs(obs) * ow
+
+        out[0] = e_1 / M - 0.5 * e_2 / (M**2) + (wabs_x - wabs_y) * (wbar - ow)
+
+    return _vrcrps_ensemble_nrg_gufunc
+
+
 estimator_gufuncs = {
     "akr_circperm": _crps_ensemble_akr_circperm_gufunc,
     "akr": _crps_ensemble_akr_gufunc,
@@ -355,6 +648,13 @@ estimator_gufuncs = {
     "vrnrg": _vrcrps_ensemble_nrg_gufunc,
 }
 
+# inner-parallel variants used when a single observation is scored against a
+# large ensemble and the batch dimension offers no parallelism
+estimator_single_funcs = {
+    "fair": _crps_ensemble_fair_single,
+    "nrg": _crps_ensemble_nrg_single,
+}
+
 __all__ = [
     "_crps_ensemble_akr_circperm_gufunc",
     "_crps_ensemble_akr_gufunc",
@@ -363,8 +663,14 @@ __all__ = [
     "_crps_ensemble_nrg_gufunc",
     "_crps_ensemble_pwm_gufunc",
     "_crps_ensemble_qd_gufunc",
+    "_crps_exponential_ufunc",
     "_crps_normal_ufunc",
     "_crps_lognormal_ufunc",
     "_crps_logistic_ufunc",
+    "estimator_single_funcs",
+    "make_ow_gufunc",
+    "make_twcrps_gufunc",
+    "make_vr_gufunc",
     "quantile_pinball_gufunc",
+    "twcrps_threshold_gufunc",
 ]
@@ -38,27 +38,44 @@ def test_ensemble(estimator, backend):
     assert not np.any(res - 0.0 > 0.0001)
 
 
+@pytest.mark.parametrize("estimator", ["nrg", "fair", "pwm"])
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_ensemble_float32(estimator, backend):
+    obs = np.random.randn(N).astype(np.float32)
+    fct = (obs[..., None] + np.random.randn(N, ENSEMBLE_SIZE) * 0.3).astype(np.float32)
+
+    res = _crps.crps_ensemble(obs, fct, estimator=estimator, backend=backend)
+    res = np.asarray(res)
+    assert res.dtype == np.float32
+
+    res64 = _crps.crps_ensemble(
+        obs.astype(np.float64),
+        fct.astype(np.float64),
+        estimator=estimator,
+        backend=backend,
+    )
+    assert np.allclose(res, np.asarray(res64), atol=1e-4)
+
+
 @pytest.mark.parametrize("backend", BACKENDS)
 def test_quantile_pinball(backend):
-    # Test quantile approximation close to analytical normal crps if forecast comes from the normal distribution
-    for mu in np.random.sample(size=10):
-        for A in [9, 99, 999]:
-            a0 = 1 / (A + 1)
-            a1 = 1 - a0
-            fct = (
-                st.norm(np.repeat(mu, N), np.ones(N))
-                .ppf(np.linspace(np.repeat(a0, N), np.repeat(a1, N), A))
-                .T
-            )
-            alpha = np.linspace(a0, a1, A)
-            obs = np.repeat(mu, N)
-            percentage_error_to_analytic = 1 - _crps.crps_quantile(
-                obs, fct, alpha, backend=backend
-            ) / _crps.crps_normal(obs, mu, 1, backend=backend)
-            percentage_error_to_analytic = np.asarray(percentage_error_to_analytic)
-            assert np.all(
-                np.abs(percentage_error_to_analytic) < 1 / A
-            ), "Quantile CRPS should be close to normal CRPS"
+    # Test quantile approximation close to analytical normal crps if forecast comes from the normal distribution.
+    # All mu configurations are stacked into a single batched call per quantile
+    # level count, instead of one dispatch per (mu, A) pair.
+    mus = np.random.sample(size=10)
+    obs = np.repeat(mus, N)
+    for A in [9, 99, 999]:
+        a0 = 1 / (A + 1)
+        a1 = 1 - a0
+        alpha = np.linspace(a0, a1, A)
+        fct = st.norm(obs[:, None], 1).ppf(alpha)
+        percentage_error_to_analytic = 1 - _crps.crps_quantile(
+            obs, fct, alpha, backend=backend
+        ) / _crps.crps_normal(obs, obs, 1, backend=backend)
+        percentage_error_to_analytic = np.asarray(percentage_error_to_analytic)
+        assert np.all(
+            np.abs(percentage_error_to_analytic) < 1 / A
+        ), "Quantile CRPS should be close to normal CRPS"
 
     # Test raise valueerror if array sizes don't match
     with pytest.raises(ValueError):
@@ -108,3 +125,17 @@ def test_lognormal(backend):
 
     assert not np.any(np.isnan(res))
     assert not np.any(res - 0.0 > 0.0001)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_exponential(backend):
+    # values from the crps_exponential docstring example
+    obs, rate = np.array([0.8, 0.9]), np.array([3.0, 2.0])
+    res = np.asarray(_crps.crps_exponential(obs, rate, backend=backend))
+    np.testing.assert_allclose(res, [0.36047864, 0.31529889], rtol=1e-6)
+
+    # strongly negative observations must not overflow the CDF into NaN
+    res = np.asarray(
+        _crps.crps_exponential(np.array([-300.0, -1.0]), 3.0, backend=backend)
+    )
+    assert not np.any(np.isnan(res))
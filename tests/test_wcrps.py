@@ -1,9 +1,11 @@
 import numpy as np
 import pytest
+from numba import njit
 from scoringrules._crps import (
     crps_ensemble,
     owcrps_ensemble,
     twcrps_ensemble,
+    twcrps_ensemble_batch,
     vrcrps_ensemble,
 )
 
@@ -82,13 +84,13 @@ def test_owcrps_score_correctness(backend):
     )
 
     def w_func(x):
-        return (x > -1).astype(float)
+        return (x > -1) * 1.0
 
     res = np.mean(np.float64(owcrps_ensemble(obs, fct, w_func, backend=backend)))
     np.testing.assert_allclose(res, 0.09320807, rtol=1e-6)
 
     def w_func(x):
-        return (x < 1.85).astype(float)
+        return (x < 1.85) * 1.0
 
     res = np.mean(np.float64(owcrps_ensemble(obs, fct, w_func, backend=backend)))
     np.testing.assert_allclose(res, 0.09933139, rtol=1e-6)
@@ -176,13 +178,73 @@ def test_vrcrps_score_correctness(backend):
     )
 
     def w_func(x):
-        return (x > -1).astype(float)
+        return (x > -1) * 1.0
 
     res = np.mean(np.float64(vrcrps_ensemble(obs, fct, w_func, backend=backend)))
     np.testing.assert_allclose(res, 0.1003983, rtol=1e-6)
 
     def w_func(x):
-        return (x < 1.85).astype(float)
+        return (x < 1.85) * 1.0
 
     res = np.mean(np.float64(vrcrps_ensemble(obs, fct, w_func, backend=backend)))
     np.testing.assert_allclose(res, 0.1950857, rtol=1e-6)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_twcrps_batch_vs_single(backend):
+    obs = np.random.randn(N)
+    mu = obs + np.random.randn(N) * 0.1
+    sigma = abs(np.random.randn(N)) * 0.3
+    fct = np.random.randn(N, ENSEMBLE_SIZE) * sigma[..., None] + mu[..., None]
+    thresholds = np.array([-1.0, 0.0, 1.0])
+
+    res_batch = np.asarray(twcrps_ensemble_batch(obs, fct, thresholds, backend=backend))
+
+    for k, t in enumerate(thresholds):
+        res = twcrps_ensemble(
+            obs,
+            fct,
+            lambda x, t=t: np.maximum(x, t),
+            estimator="nrg",
+            backend="numpy",
+        )
+        np.testing.assert_allclose(res_batch[..., k], res, rtol=1e-4, atol=1e-6)
+
+
+@pytest.mark.parametrize("axis", [-1, 0])
+def test_owcrps_vrcrps_jitted_weight(axis):
+    obs = np.random.randn(N)
+    fct = np.random.randn(N, ENSEMBLE_SIZE) + obs[..., None]
+    fct_in = fct.T if axis == 0 else fct
+
+    @njit
+    def w_func(x):
+        return (x > -1) * 1.0
+
+    def w_func_py(x):
+        return (x > -1) * 1.0
+
+    for fn in (owcrps_ensemble, vrcrps_ensemble):
+        res_fused = fn(obs, fct_in, w_func, axis=axis, backend="numba")
+        res_plain = fn(obs, fct, w_func_py, backend="numba")
+        np.testing.assert_allclose(res_fused, res_plain, rtol=1e-10)
+
+
+@pytest.mark.parametrize("axis", [-1, 0])
+def test_twcrps_jitted_chaining(axis):
+    obs = np.random.randn(N)
+    fct = np.random.randn(N, ENSEMBLE_SIZE) + obs[..., None]
+    fct_in = fct.T if axis == 0 else fct
+
+    @njit
+    def v_func(x):
+        return max(x, -1.0)
+
+    def v_func_py(x):
+        return np.maximum(x, -1.0)
+
+    res_fused = twcrps_ensemble(
+        obs, fct_in, v_func, axis=axis, estimator="nrg", backend="numba"
+    )
+    res_plain = twcrps_ensemble(obs, fct, v_func_py, estimator="nrg", backend="numba")
+    np.testing.assert_allclose(res_fused, res_plain, rtol=1e-10)